@@ -2,20 +2,24 @@ from utils import generate_expense_id, utc_timestamp
 
 SYSTEM_NOTE = 'Tracked by Python authomation'
 
-def process_expenses(sheet): 
+def process_expenses(sheet):
     rows = sheet.get_all_records()
     updates = []
 
-    for index, row in enumerate(rows, start=2): 
-        if row.get('expense_id'): 
+    for index, row in enumerate(rows, start=2):
+        if row.get('expense_id'):
             continue
 
+        # One contiguous F:I range per row so all four system columns
+        # can be written together in a single batch_update call
         updates.append({
-            'row': index, 
-            'expense_id': generate_expense_id(),
-            'processed': True, 
-            'processed_at': utc_timestamp(),
-            'script_notes': SYSTEM_NOTE
+            'range': f'F{index}:I{index}',
+            'values': [[
+                generate_expense_id(),
+                True,
+                utc_timestamp(),
+                SYSTEM_NOTE
+            ]]
         })
 
     return updates
\ No newline at end of file
@@ -9,12 +9,10 @@ def main():
 
     updates = process_expenses(sheet)
 
-    for update in updates:
-        row = update["row"]
-        sheet.update_cell(row, 6, update["expense_id"])      # F
-        sheet.update_cell(row, 7, update["processed"])       # G
-        sheet.update_cell(row, 8, update["processed_at"])    # H
-        sheet.update_cell(row, 9, update["script_notes"])    # I
+    # Write all rows in one API call instead of 4 update_cell
+    # round-trips per row
+    if updates:
+        sheet.batch_update(updates, value_input_option="RAW")
 
     print(f"Processed {len(updates)} new expenses")
 
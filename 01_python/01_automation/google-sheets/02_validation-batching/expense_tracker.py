@@ -2,22 +2,151 @@
 Expense Tracker Module - Version 2
 Handles expense validation, duplicate checking, and batch operations.
 """
+import asyncio
+import operator
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
 import gspread
 from utils import generate_expense_id, utc_timestamp
 
-def validate_expense(expense_data: dict) -> tuple[bool, str]:
+try:
+    # Optional: pandas enables the vectorized batch path for large
+    # CSV-scale imports (see batch_add_expenses_df)
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+@dataclass(slots=True)
+class Expense:
     """
-    Validates an expense entry and prompts user for missing required fields.
-    
-    Required fields: date, description, amount
-    
+    A single expense with a fixed, slotted field layout.
+
+    Field order matches the Expenses worksheet columns A-I, so _row_of
+    yields a ready-to-append row with no per-field dict lookups.
+    slots=True drops the per-instance __dict__, cutting memory and
+    attribute-access overhead for large batches.
+    """
+    date: str = ''
+    description: str = ''
+    amount: str = ''
+    category: str = ''
+    payment_method: str = ''
+    expense_id: str = ''
+    processed: bool = False
+    processed_at: str = ''
+    script_notes: str = ''
+
+    @classmethod
+    def from_dict(cls, expense_data: dict) -> "Expense":
+        """
+        Builds an Expense from a user-supplied dictionary.
+
+        Only the user-editable fields are taken; system-managed fields
+        are always assigned by the processing code. Unknown keys are
+        ignored.
+        """
+        return cls(
+            date=expense_data.get('date', ''),
+            description=expense_data.get('description', ''),
+            amount=expense_data.get('amount', ''),
+            category=expense_data.get('category', ''),
+            payment_method=expense_data.get('payment_method', '')
+        )
+
+
+# C-implemented multi-getter: pulls all nine fields into a tuple in one
+# call, versus nine attribute-access bytecode round-trips per row (and
+# unlike dataclasses.astuple it doesn't recursively copy field values)
+_row_of = operator.attrgetter(
+    'date', 'description', 'amount', 'category', 'payment_method',
+    'expense_id', 'processed', 'processed_at', 'script_notes'
+)
+
+
+def expense_to_row(expense: Expense) -> list:
+    """
+    Converts an Expense into a worksheet row (columns A-I, in order).
+
     Args:
-        expense_data: Dictionary containing expense fields (date, description, amount, etc.)
-                     This dict will be modified in place if user provides missing values.
-        
+        expense: The expense to convert
+
     Returns:
-        Tuple of (is_valid: bool, error_message: str)
-        If valid, error_message will be empty string.
+        List of cell values ready for append_row / append_rows
+    """
+    return list(_row_of(expense))
+
+# The Sheets API caps a single write request at 50,000 cells and
+# rate-limits bursts with 429s; stay under the cap with some headroom
+MAX_CELLS_PER_WRITE = 45_000
+NUM_EXPENSE_COLS = 9
+APPEND_CHUNK_ROWS = MAX_CELLS_PER_WRITE // NUM_EXPENSE_COLS
+
+MAX_RETRIES = 5
+
+
+def _retry_backoff(request_fn):
+    """
+    Calls request_fn, retrying with exponential backoff on quota errors.
+
+    Retries only on 429 (rate limit) and 5xx responses, sleeping
+    2**attempt seconds between tries. Other API errors propagate
+    immediately.
+
+    Args:
+        request_fn: Zero-argument callable that issues the API request
+
+    Returns:
+        Whatever request_fn returns
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            return request_fn()
+        except gspread.exceptions.APIError as error:
+            status = error.response.status_code
+            if status != 429 and status < 500:
+                # Not a quota/server error - don't retry
+                raise
+            if attempt == MAX_RETRIES - 1:
+                # Out of retries
+                raise
+            time.sleep(2 ** attempt)
+
+
+def _append_rows_chunked(worksheet, rows: list[list],
+                         value_input_option: str = "RAW") -> None:
+    """
+    Appends rows in quota-sized chunks, with retry/backoff per chunk.
+
+    Large imports can exceed the per-request cell limit; pre-splitting
+    avoids a failed oversized request, and backoff absorbs transient
+    429/5xx responses instead of aborting the whole batch.
+
+    Args:
+        worksheet: The gspread worksheet object to append to
+        rows: Fully-built row lists
+        value_input_option: Passed through to append_rows
+    """
+    for start in range(0, len(rows), APPEND_CHUNK_ROWS):
+        chunk = rows[start:start + APPEND_CHUNK_ROWS]
+        _retry_backoff(
+            lambda: worksheet.append_rows(chunk, value_input_option=value_input_option)
+        )
+
+def _fill_missing_fields(expense: Expense) -> None:
+    """
+    Prompts the user for any missing required fields (interactive).
+
+    Required fields: date, description, amount
+
+    Args:
+        expense: The Expense to complete. It is modified in place if the
+                 user provides missing values.
     """
     # Check for missing required fields and prompt user
     required_fields = {
@@ -25,188 +154,672 @@ def validate_expense(expense_data: dict) -> tuple[bool, str]:
         'description': 'Enter the expense description: ',
         'amount': 'Enter the expense amount: '
     }
-    
+
     # Loop through required_fields and check if each exists and is not empty
     # If missing or empty, use input() to prompt user
-    # Update expense_data with the user's input
     for field_name, prompt_message in required_fields.items():
-        # Get current value, default to empty string if not present
-        current_value = expense_data.get(field_name, '')
-        
+        current_value = getattr(expense, field_name)
+
         # Check if value is missing or empty (after stripping whitespace)
         if not current_value or not str(current_value).strip():
             # Prompt user for the missing value
             user_input = input(prompt_message)
-            # Update expense_data with user's input
-            expense_data[field_name] = user_input.strip()
-    
-    
+            setattr(expense, field_name, user_input.strip())
+
+
+def validate_expense(expense: Expense) -> tuple[bool, str]:
+    """
+    Validates an expense entry and prompts user for missing required fields.
+
+    Args:
+        expense: The Expense to validate. It is modified in place if the
+                 user provides missing values.
+
+    Returns:
+        Tuple of (is_valid: bool, error_message: str)
+        If valid, error_message will be empty string.
+    """
+    _fill_missing_fields(expense)
+
     # After ensuring all required fields exist, validate amount is numeric
     try:
         # Try to convert amount to float
-        float(expense_data['amount'])
+        float(expense.amount)
         return True, ""
     except (ValueError, TypeError):
         # If conversion fails, return error
         return False, "Amount must be a valid number"
 
 
-def check_duplicate(sheet, date: str, description: str, amount: str) -> bool:
+def validate_expense_strict(expense: Expense) -> tuple[bool, str]:
     """
-    Checks if an expense with the same date, description, and amount already exists.
-    
+    Non-interactive validation for batch mode.
+
+    Batch jobs can't block on stdin, so a missing required field is an
+    error (destined for the Errors sheet) rather than a prompt. The
+    interactive single-expense path keeps using validate_expense.
+
+    Args:
+        expense: The Expense to validate
+
+    Returns:
+        Tuple of (is_valid: bool, error_message: str)
+        If valid, error_message will be empty string.
+    """
+    for field_name in ('date', 'description', 'amount'):
+        if not str(getattr(expense, field_name)).strip():
+            return False, f"Missing required field: {field_name}"
+
+    try:
+        float(expense.amount)
+        return True, ""
+    except (ValueError, TypeError):
+        return False, "Amount must be a valid number"
+
+
+def _validate_and_key(expense: Expense) -> tuple[str, tuple | None]:
+    """
+    Pure (no I/O) validation plus duplicate-key computation for one expense.
+
+    Safe to run on worker threads: it only touches the expense itself and
+    does string/number work, no stdin prompting and no API calls.
+
+    Args:
+        expense: The Expense to check
+
+    Returns:
+        Tuple of (error_message, key). error_message is '' when valid;
+        key is the normalized duplicate-index tuple (or None).
+    """
+    is_valid, error_message = validate_expense_strict(expense)
+    if not is_valid:
+        return error_message, None
+    return "", _duplicate_key(expense.date, expense.description, expense.amount)
+
+
+def _parse_float(value) -> float | None:
+    """
+    Safely converts a value to float.
+
+    Args:
+        value: The value to convert (string, number, or anything else)
+
+    Returns:
+        The float value, or None if the value is not a valid number
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Only the columns the duplicate check actually needs (A=date,
+# B=description, C=amount) - fetching the full sheet inflates both the
+# response size and the JSON parse time for no benefit
+DUPLICATE_CHECK_RANGE = "A2:C"
+
+
+def _fetch_existing_rows(sheet) -> list[list]:
+    """
+    Fetches only the date/description/amount columns of existing expenses.
+
+    Returns raw row lists rather than get_all_records() dicts: bytes on
+    the wire scale with 3 columns instead of all 9, and no per-row dict
+    construction is needed.
+
+    UNFORMATTED_VALUE makes the API return numeric cells as real numbers
+    (not display strings), so amounts don't need to be re-parsed with
+    float() on every row. Date-typed cells would come back as serial
+    numbers under that option, so FORMATTED_STRING keeps them as the
+    display strings that user-typed dates are compared against.
+
+    Args:
+        sheet: The gspread worksheet object
+
+    Returns:
+        List of [date, description, amount] row lists (may be ragged)
+    """
+    return sheet.get(
+        DUPLICATE_CHECK_RANGE,
+        value_render_option="UNFORMATTED_VALUE",
+        date_time_render_option="FORMATTED_STRING"
+    )
+
+
+def _build_duplicate_index(rows: list[list]) -> set[tuple]:
+    """
+    Builds an in-memory index of existing expenses for O(1) duplicate lookups.
+
+    Each expense is normalized into a (date, description, amount) tuple:
+    - date and description are stripped of whitespace
+    - description is casefolded (Unicode-correct case-insensitive matching)
+    - amount is converted to float
+
+    Rows are normalized exactly once here; lookups normalize the query
+    side exactly once via _duplicate_key, so no per-comparison string
+    work remains.
+
+    Rows with missing or invalid amounts are skipped (they can't be
+    duplicated).
+
+    Args:
+        rows: List of [date, description, amount] lists from _fetch_existing_rows
+
+    Returns:
+        Set of normalized (date, description, amount) tuples
+    """
+    seen = set()
+    for row in rows:
+        if len(row) < 3:
+            # Ragged row - missing one of the key columns
+            continue
+        amount = row[2]
+        if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+            # With UNFORMATTED_VALUE numeric cells are already numbers
+            amount_value = float(amount)
+        else:
+            # Text cells (our own RAW appends store amounts as text)
+            # still need a parse; unparseable ones can't be duplicated
+            amount_value = _parse_float(amount)
+            if amount_value is None:
+                continue
+        seen.add((
+            str(row[0]).strip(),
+            str(row[1]).strip().casefold(),
+            amount_value
+        ))
+    return seen
+
+
+def _duplicate_key(date, description, amount) -> tuple | None:
+    """
+    Normalizes an expense into its duplicate-index key.
+
+    Args:
+        date: Expense date
+        description: Expense description
+        amount: Expense amount (string or number)
+
+    Returns:
+        A (date, description, amount) tuple matching the index entries,
+        or None if the amount is not a valid number
+    """
+    amount_value = _parse_float(amount)
+    if amount_value is None:
+        # If amount can't be converted, it's invalid, so no duplicate possible
+        return None
+    return (str(date).strip(), str(description).strip().casefold(), amount_value)
+
+
+# On-disk cache of the duplicate index, so repeated runs (cron-style
+# invocations) don't re-download the whole sheet every time
+INDEX_CACHE_DIR = Path(".expense_index_cache")
+
+# Data-row counts observed by load_duplicate_index this run, so the
+# on-disk cache can be advanced in place after our own appends
+_index_row_counts: dict = {}
+
+
+def _index_cache_path(sheet) -> Path:
+    """Returns the cache file path for a worksheet (per spreadsheet + tab)."""
+    return INDEX_CACHE_DIR / f"{sheet.spreadsheet.id}_{sheet.id}.pickle"
+
+
+def _load_cached_index(sheet) -> tuple[int, set] | None:
+    """
+    Loads the cached duplicate index for a worksheet, if present.
+
+    Args:
+        sheet: The gspread worksheet object
+
+    Returns:
+        Tuple of (cached data-row count, index set), or None when there
+        is no usable cache (missing, unreadable, or corrupt file)
+    """
+    try:
+        with open(_index_cache_path(sheet), 'rb') as cache_file:
+            cached = pickle.load(cache_file)
+        return cached['data_rows'], set(cached['keys'])
+    except (OSError, pickle.PickleError, KeyError, TypeError):
+        # Any problem with the cache just means a cold run
+        return None
+
+
+def _save_cached_index(sheet, data_rows: int, index: set) -> None:
+    """
+    Persists the duplicate index for a worksheet to disk.
+
+    Args:
+        sheet: The gspread worksheet object
+        data_rows: Number of data rows the index was built from
+        index: The duplicate index set
+    """
+    try:
+        INDEX_CACHE_DIR.mkdir(exist_ok=True)
+        with open(_index_cache_path(sheet), 'wb') as cache_file:
+            pickle.dump({'data_rows': data_rows, 'keys': list(index)}, cache_file)
+    except OSError:
+        # Caching is best-effort; a read-only disk shouldn't break the run
+        pass
+
+
+def load_duplicate_index(sheet) -> set[tuple]:
+    """
+    Fetches existing expenses and builds the duplicate index.
+
+    Uses the on-disk cache between runs: cold runs fetch the whole A2:C
+    range, warm runs fetch only the rows appended since the cached
+    snapshot - still one API call, but with a near-empty payload when
+    the sheet hasn't grown. Edits to previously-cached rows are not
+    re-read; expense rows are treated as append-only.
+
+    Args:
+        sheet: The gspread worksheet object
+
+    Returns:
+        Set of normalized (date, description, amount) tuples
+    """
+    fetch_range, cached_rows, index = _pending_index_state(sheet)
+    index, _ = _fetch_and_integrate(sheet, fetch_range, cached_rows, index)
+    return index
+
+
+def _pending_index_state(sheet) -> tuple[str, int, set]:
+    """
+    Determines what still needs fetching to bring the index up to date.
+
+    Args:
+        sheet: The gspread worksheet object
+
+    Returns:
+        Tuple of (A1 range to fetch, cached data-row count, cached index).
+        Cold runs get the full range and an empty index; warm runs get
+        only the delta range past the cached snapshot (+2 skips the
+        header row and the rows already covered).
+    """
+    cached = _load_cached_index(sheet)
+    if cached is None:
+        return DUPLICATE_CHECK_RANGE, 0, set()
+    cached_rows, index = cached
+    return f"A{cached_rows + 2}:C", cached_rows, index
+
+
+def _integrate_fetched_rows(sheet, rows: list[list],
+                            cached_rows: int, index: set) -> set:
+    """
+    Folds freshly fetched rows into the index and updates the cache.
+
+    Args:
+        sheet: The gspread worksheet object the rows came from
+        rows: Row lists fetched for the pending range (may be empty)
+        cached_rows: Data-row count the cache already covered
+        index: The cached index to extend
+
+    Returns:
+        The up-to-date duplicate index
+    """
+    if rows:
+        index |= _build_duplicate_index(rows)
+        cached_rows += len(rows)
+        _save_cached_index(sheet, cached_rows, index)
+    _index_row_counts[_index_cache_path(sheet)] = cached_rows
+    return index
+
+
+def _fetch_and_integrate(sheet, fetch_range: str,
+                         cached_rows: int, index: set) -> tuple[set, bool]:
+    """
+    Fetches the pending range and folds it into the index.
+
+    Warm-run delta ranges can be rejected when the cache has gone stale
+    (rows deleted, or the delta start landing past the grid); rather
+    than requiring operators to delete the pickle by hand, fall back to
+    a full A2:C refetch and rebuild the cache from scratch.
+
     Args:
         sheet: The gspread worksheet object
+        fetch_range: A1 range from _pending_index_state
+        cached_rows: Data-row count the cache already covered
+        index: The cached index to extend
+
+    Returns:
+        Tuple of (up-to-date index, rebuilt flag). rebuilt is True when
+        the delta range failed and the index was refetched in full.
+    """
+    try:
+        rows = sheet.get(
+            fetch_range,
+            value_render_option="UNFORMATTED_VALUE",
+            date_time_render_option="FORMATTED_STRING"
+        )
+    except gspread.exceptions.APIError:
+        if fetch_range == DUPLICATE_CHECK_RANGE:
+            # Cold-run fetch of the full range - nothing to heal
+            raise
+        # Stale cache: refetch everything and rewrite the cache so the
+        # next run starts from a consistent snapshot
+        rows = sheet.get(
+            DUPLICATE_CHECK_RANGE,
+            value_render_option="UNFORMATTED_VALUE",
+            date_time_render_option="FORMATTED_STRING"
+        )
+        index = _build_duplicate_index(rows)
+        _index_row_counts[_index_cache_path(sheet)] = len(rows)
+        _save_cached_index(sheet, len(rows), index)
+        return index, True
+
+    return _integrate_fetched_rows(sheet, rows, cached_rows, index), False
+
+
+def load_batch_state(sheet, spreadsheet) -> set[tuple]:
+    """
+    Builds the duplicate index and probes the Errors sheet in one request.
+
+    The index rows (Expenses tab) and the Errors header row live on
+    different worksheets, but the Sheets API can read both ranges in a
+    single values batchGet - one HTTP round-trip instead of two. What the
+    probe learns about the Errors sheet is remembered so the first error
+    flush can skip its own lookup work.
+
+    Args:
+        sheet: The gspread worksheet object (Expenses sheet)
+        spreadsheet: The gspread spreadsheet object
+
+    Returns:
+        Set of normalized (date, description, amount) tuples
+    """
+    fetch_range, cached_rows, index = _pending_index_state(sheet)
+
+    try:
+        # 429/5xx get _retry_backoff's retries like every other write;
+        # only a genuine request error falls through to the except below
+        response = _retry_backoff(
+            lambda: spreadsheet.values_batch_get(
+                [f"{sheet.title}!{fetch_range}", f"{ERROR_SHEET_NAME}!A1:G1"],
+                params={
+                    'valueRenderOption': 'UNFORMATTED_VALUE',
+                    'dateTimeRenderOption': 'FORMATTED_STRING'
+                }
+            )
+        )
+    except gspread.exceptions.APIError as error:
+        # Fall back to the single-range read so the batch can proceed
+        index, rebuilt = _fetch_and_integrate(sheet, fetch_range, cached_rows, index)
+
+        # A range on a missing worksheet fails the whole batch request
+        # with a 400 INVALID_ARGUMENT - but only conclude the Errors
+        # sheet is missing when our own range fetched cleanly (a rebuilt
+        # index means the stale delta range could have caused the 400).
+        # Exhausted retries or anything else are indeterminate: record
+        # nothing and let _get_errors_sheet do its own probe later.
+        if error.response.status_code == 400 and not rebuilt:
+            _errors_sheet_probe[spreadsheet.id] = 'missing'
+
+        return index
+
+    value_ranges = response.get('valueRanges', [])
+    rows = value_ranges[0].get('values', []) if value_ranges else []
+
+    # The batch request succeeded, so the Errors sheet exists; record
+    # whether its header row is already in place
+    header = value_ranges[1].get('values', []) if len(value_ranges) > 1 else []
+    _errors_sheet_probe[spreadsheet.id] = 'exists' if header else 'exists-no-header'
+
+    return _integrate_fetched_rows(sheet, rows, cached_rows, index)
+
+
+def _advance_cached_index(sheet, num_new_rows: int, index: set) -> None:
+    """
+    Updates the cached index in place after rows we just wrote.
+
+    The appended keys are already in the in-memory index (they were added
+    during batch processing), so the next run shouldn't re-read rows this
+    run wrote - just bump the row count and rewrite the cache file.
+
+    Args:
+        sheet: The gspread worksheet object the rows were appended to
+        num_new_rows: How many rows were appended
+        index: The in-memory duplicate index, including the new keys
+    """
+    cache_path = _index_cache_path(sheet)
+    if cache_path in _index_row_counts:
+        _index_row_counts[cache_path] += num_new_rows
+        _save_cached_index(sheet, _index_row_counts[cache_path], index)
+
+
+def check_duplicate(index: set[tuple], date: str, description: str, amount: str) -> bool:
+    """
+    Checks if an expense with the same date, description, and amount already exists.
+
+    Probes a prebuilt duplicate index - a single hash lookup instead of a
+    linear scan over every existing row. Callers build the index once with
+    load_duplicate_index and reuse it across checks.
+
+    Args:
+        index: Duplicate index from load_duplicate_index
         date: Expense date
         description: Expense description
         amount: Expense amount (as string)
-        
+
     Returns:
         True if duplicate exists, False otherwise
     """
-    # Get all existing expense records from the sheet
-    existing_expenses = sheet.get_all_records()
-    
-    # Normalize the input amount to float for comparison
-    # This handles cases where amounts might be stored as strings or numbers
-    try:
-        input_amount = float(amount)
-    except (ValueError, TypeError):
-        # If amount can't be converted, it's invalid, so no duplicate possible
-        return False
-    
-    # Loop through all existing expenses
-    for expense in existing_expenses:
-        # Get values from the existing expense row
-        existing_date = expense.get('date', '')
-        existing_description = expense.get('description', '')
-        existing_amount_str = expense.get('amount', '')
-        
-        # Normalize existing amount to float for comparison
-        try:
-            existing_amount = float(existing_amount_str)
-        except (ValueError, TypeError):
-            # Skip this row if amount is invalid
-            continue
-        
-        # Compare all three fields: date, description, and amount
-        # Strip whitespace for date and description to handle formatting differences
-        if (str(existing_date).strip() == str(date).strip() and
-            str(existing_description).strip().lower() == str(description).strip().lower() and
-            existing_amount == input_amount):
-            # Found a duplicate!
-            return True
-    
-    # No duplicate found after checking all rows
-    return False
+    key = _duplicate_key(date, description, amount)
+    return key is not None and key in index
 
 
-def add_expense(sheet, expense_data: dict) -> tuple[bool, dict, str]:
+def add_expense(sheet, expense_data: dict) -> tuple[bool, Expense, str]:
     """
     Validates and adds an expense, checking for duplicates and prompting user if needed.
-    
+
     Args:
         sheet: The gspread worksheet object
         expense_data: Dictionary containing expense fields (date, description, amount, etc.)
-        
+
     Returns:
-        Tuple of (success: bool, expense_data: dict, error_message: str)
-        - If success is True: expense_data will contain the validated expense with system fields
+        Tuple of (success: bool, expense: Expense, error_message: str)
+        - If success is True: expense will contain the validated expense with system fields
         - If success is False: error_message will contain the reason
     """
+    expense = Expense.from_dict(expense_data)
+
     # Step 1: Validate the expense (this will prompt for missing fields)
-    is_valid, error_message = validate_expense(expense_data)
-    
+    is_valid, error_message = validate_expense(expense)
+
     if not is_valid:
         # Validation failed, return error
-        return False, expense_data, error_message
-    
-    # Step 2: Check for duplicates
-    date = expense_data.get('date', '')
-    description = expense_data.get('description', '')
-    amount = expense_data.get('amount', '')
-    
-    is_duplicate = check_duplicate(sheet, date, description, amount)
-    
+        return False, expense, error_message
+
+    # Step 2: Check for duplicates (one sheet read, then a hash probe)
+    index = load_duplicate_index(sheet)
+    is_duplicate = check_duplicate(index, expense.date, expense.description, expense.amount)
+
     if is_duplicate:
         # Duplicate found - prompt user for confirmation
         print(f"\n⚠️  Duplicate expense detected!")
-        print(f"   Date: {date}")
-        print(f"   Description: {description}")
-        print(f"   Amount: {amount}")
+        print(f"   Date: {expense.date}")
+        print(f"   Description: {expense.description}")
+        print(f"   Amount: {expense.amount}")
         user_response = input("This expense was added before. Do you want to add it again? (yes/no): ")
-        
+
         if user_response.lower() not in ['yes', 'y']:
             # User chose not to add duplicate
-            return False, expense_data, "Duplicate expense - user chose not to add"
-    
-    # Step 3: Add system-managed fields to expense_data
-    expense_data['expense_id'] = generate_expense_id()
-    expense_data['processed'] = True
-    expense_data['processed_at'] = utc_timestamp()
-    expense_data['script_notes'] = 'Tracked by Python automation v2'
-    
-    # Success! Return the complete expense data
-    return True, expense_data, ""
+            return False, expense, "Duplicate expense - user chose not to add"
+
+    # Step 3: Add system-managed fields
+    expense.expense_id = generate_expense_id()
+    expense.processed = True
+    expense.processed_at = utc_timestamp()
+    expense.script_notes = 'Tracked by Python automation v2'
+
+    # Success! Return the complete expense
+    return True, expense, ""
+
+
+ERROR_SHEET_NAME = "Errors"
+
+ERROR_SHEET_HEADERS = [
+    'date',
+    'description',
+    'amount',
+    'category',
+    'payment_method',
+    'error_message',
+    'logged_at'
+]
+
 
+# Cache of resolved Errors worksheets, keyed by spreadsheet id.
+# The worksheet lookup (and the WorksheetNotFound probe on a fresh
+# spreadsheet) then costs at most one API round-trip per run.
+_errors_sheet_cache: dict = {}
 
-def log_error(spreadsheet, expense_data: dict, error_message: str) -> None:
+# What the startup batchGet learned about the Errors sheet, keyed by
+# spreadsheet id: 'exists', 'exists-no-header', or 'missing'. Lets
+# _get_errors_sheet skip the doomed lookup / redundant header write.
+_errors_sheet_probe: dict = {}
+
+
+def _get_errors_sheet(spreadsheet):
     """
-    Logs an invalid expense to the "Errors" worksheet.
-    
-    Creates the "Errors" worksheet if it doesn't exist.
-    
+    Returns the "Errors" worksheet, creating it (with headers) if missing.
+
+    The resolved worksheet object is memoized per spreadsheet, so repeated
+    error logging doesn't re-issue the metadata lookup on every call.
+
     Args:
         spreadsheet: The gspread spreadsheet object (not worksheet)
-        expense_data: Dictionary containing the invalid expense data
-        error_message: The error message explaining why it's invalid
+
+    Returns:
+        The gspread worksheet object for the Errors sheet
     """
-    ERROR_SHEET_NAME = "Errors"
-    
-    try:
-        # Try to get the Errors worksheet
-        error_sheet = spreadsheet.worksheet(ERROR_SHEET_NAME)
-    except gspread.exceptions.WorksheetNotFound:
-        # If it doesn't exist, create it with headers
+    cached = _errors_sheet_cache.get(spreadsheet.id)
+    if cached is not None:
+        return cached
+
+    probe = _errors_sheet_probe.get(spreadsheet.id)
+    if probe == 'missing':
+        # The startup batchGet already established the sheet is absent -
+        # go straight to creation instead of a doomed lookup
         error_sheet = spreadsheet.add_worksheet(
             title=ERROR_SHEET_NAME,
             rows=1000,
             cols=10
         )
-        # Set up headers
-        headers = [
-            'date',
-            'description',
-            'amount',
-            'category',
-            'payment_method',
-            'error_message',
-            'logged_at'
-        ]
-        error_sheet.append_row(headers)
-    
-    # Prepare the error row data
-    error_row = [
-        expense_data.get('date', ''),
-        expense_data.get('description', ''),
-        expense_data.get('amount', ''),
-        expense_data.get('category', ''),
-        expense_data.get('payment_method', ''),
+        error_sheet.append_row(ERROR_SHEET_HEADERS)
+    else:
+        try:
+            # Try to get the Errors worksheet
+            error_sheet = spreadsheet.worksheet(ERROR_SHEET_NAME)
+        except gspread.exceptions.WorksheetNotFound:
+            # If it doesn't exist, create it with headers
+            error_sheet = spreadsheet.add_worksheet(
+                title=ERROR_SHEET_NAME,
+                rows=1000,
+                cols=10
+            )
+            error_sheet.append_row(ERROR_SHEET_HEADERS)
+        else:
+            if probe == 'exists-no-header':
+                # Sheet existed but was empty at startup - put the
+                # header row in before the first error rows land
+                error_sheet.append_row(ERROR_SHEET_HEADERS)
+
+    _errors_sheet_cache[spreadsheet.id] = error_sheet
+    return error_sheet
+
+
+def format_error_row(expense: Expense, error_message: str,
+                     logged_at: str | None = None) -> list:
+    """
+    Formats an invalid expense into a row for the Errors worksheet.
+
+    Args:
+        expense: The invalid expense
+        error_message: The error message explaining why it's invalid
+        logged_at: Optional shared timestamp; batch callers compute one
+                   timestamp per batch instead of one per row
+
+    Returns:
+        List of cell values matching ERROR_SHEET_HEADERS
+    """
+    return [
+        expense.date,
+        expense.description,
+        expense.amount,
+        expense.category,
+        expense.payment_method,
         error_message,
-        utc_timestamp()
+        logged_at if logged_at is not None else utc_timestamp()
     ]
-    
-    # Append the error row to the Errors sheet
-    error_sheet.append_row(error_row)
+
+
+def flush_errors(spreadsheet, error_rows: list[list]) -> None:
+    """
+    Writes a batch of error rows to the Errors worksheet in one API call.
+
+    Args:
+        spreadsheet: The gspread spreadsheet object (not worksheet)
+        error_rows: List of rows built by format_error_row
+    """
+    if not error_rows:
+        return
+
+    error_sheet = _get_errors_sheet(spreadsheet)
+    # One batched append instead of one append_row per error
+    _append_rows_chunked(error_sheet, error_rows)
+
+
+def log_error(spreadsheet, expense: Expense, error_message: str) -> None:
+    """
+    Logs a single invalid expense to the "Errors" worksheet.
+
+    Thin wrapper for the single-expense path; batch operations collect
+    rows with format_error_row and call flush_errors once instead.
+
+    Args:
+        spreadsheet: The gspread spreadsheet object (not worksheet)
+        expense: The invalid expense
+        error_message: The error message explaining why it's invalid
+    """
+    flush_errors(spreadsheet, [format_error_row(expense, error_message)])
+
+
+async def _flush_writes(sheet, rows_to_add: list[list],
+                        spreadsheet, error_rows: list[list]) -> None:
+    """
+    Issues the batched Expenses append and the Errors-sheet append concurrently.
+
+    The two targets are independent worksheets, so the blocking gspread calls
+    are moved onto worker threads with asyncio.to_thread and awaited together
+    instead of serially.
+
+    Args:
+        sheet: The gspread worksheet object (Expenses sheet)
+        rows_to_add: Fully-built rows for a single append_rows call
+        spreadsheet: The gspread spreadsheet object (needed for error logging)
+        error_rows: Error rows built by format_error_row, flushed in one call
+    """
+    tasks = []
+    if rows_to_add:
+        tasks.append(asyncio.to_thread(_append_rows_chunked, sheet, rows_to_add))
+    if error_rows and spreadsheet:
+        tasks.append(asyncio.to_thread(flush_errors, spreadsheet, error_rows))
+
+    if tasks:
+        await asyncio.gather(*tasks)
 
 
 def batch_add_expenses(sheet, expenses_list: list[dict], spreadsheet=None) -> dict:
     """
     Processes and adds multiple expenses in a batch operation.
-    
-    Validates each expense, checks for duplicates, and batches all valid expenses
-    into a single API call for efficiency.
-    
+
+    Validates each expense strictly (no interactive prompting - suitable
+    for CSV imports and scheduled jobs), checks for duplicates, and
+    batches all valid expenses into a single API call for efficiency.
+    Invalid rows are logged to the Errors sheet.
+
+
     Args:
         sheet: The gspread worksheet object (Expenses sheet)
         expenses_list: List of expense dictionaries to process
@@ -219,45 +832,68 @@ def batch_add_expenses(sheet, expenses_list: list[dict], spreadsheet=None) -> di
             'success_count': int,
             'error_count': int,
             'duplicate_count': int,
-            'added_expenses': list[dict],
-            'errors': list[dict]  # Each error dict has 'expense' and 'message'
+            'added_expenses': list[Expense],
+            'errors': list[dict]  # Each error dict has 'expense' (Expense) and 'message'
         }
     """
     # Get spreadsheet object if not provided (needed for error logging)
     if spreadsheet is None:
         spreadsheet = sheet.spreadsheet
     
+    # Precompute one ID per input expense up front (cheap, and keeps the
+    # per-expense loop free of uuid calls); at most len(expenses_list)
+    # are ever needed
+    expense_ids = [generate_expense_id() for _ in range(len(expenses_list))]
+
+    # The whole batch shares one logical processed_at / logged_at, so
+    # compute the timestamp once instead of once per expense
+    batch_timestamp = utc_timestamp()
+
+    # Fetch existing rows ONCE and build the duplicate index up front
+    # (previously check_duplicate re-fetched the entire sheet for every
+    # expense). With a spreadsheet handle the same request also probes
+    # the Errors sheet, folding two reads into one round-trip.
+    if spreadsheet:
+        seen = load_batch_state(sheet, spreadsheet)
+    else:
+        seen = load_duplicate_index(sheet)
+
     # Results tracking
     valid_expenses = []
     errors = []
     duplicate_count = 0
-    
-    # Process each expense
-    for expense_data in expenses_list:
-        # Make a copy to avoid modifying the original
-        expense = expense_data.copy()
-        
-        # Validate the expense
-        is_valid, error_message = validate_expense(expense)
-        
-        if not is_valid:
-            # Validation failed - log error
+    error_rows = []
+
+    # Parse into slotted structs once; the originals stay untouched.
+    # Batch mode validates strictly (no stdin prompting) - incomplete
+    # rows become error-log entries instead of stalling the whole batch.
+    parsed_expenses = [Expense.from_dict(expense_data) for expense_data in expenses_list]
+
+    # Validation + key normalization is independent per expense (pure
+    # string/number work against the in-memory index), so fan it out
+    # across worker threads for large batches
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        prepared = list(executor.map(_validate_and_key, parsed_expenses, chunksize=64))
+
+    # Combine results serially - duplicate bookkeeping is order-dependent
+    for expense, (error_message, key) in zip(parsed_expenses, prepared):
+        if error_message:
+            # Validation failed - remember the error; all error rows go to
+            # the Errors sheet in ONE append at the end, overlapped with
+            # the main append
             errors.append({
                 'expense': expense,
                 'message': error_message
             })
             if spreadsheet:
-                log_error(spreadsheet, expense, error_message)
+                error_rows.append(
+                    format_error_row(expense, error_message, batch_timestamp)
+                )
             continue
-        
-        # Check for duplicates
-        date = expense.get('date', '')
-        description = expense.get('description', '')
-        amount = expense.get('amount', '')
-        
-        is_duplicate = check_duplicate(sheet, date, description, amount)
-        
-        if is_duplicate:
+
+        # Check for duplicates against the in-memory index (O(1) lookup,
+        # no extra API calls)
+        if key is not None and key in seen:
             # Duplicate found - skip it (in batch mode, we skip duplicates)
             # You could modify this to prompt user, but for batch operations,
             # skipping is usually better
@@ -267,40 +903,36 @@ def batch_add_expenses(sheet, expenses_list: list[dict], spreadsheet=None) -> di
                 'message': 'Duplicate expense - skipped'
             })
             continue
-        
-        # Add system-managed fields
-        expense['expense_id'] = generate_expense_id()
-        expense['processed'] = True
-        expense['processed_at'] = utc_timestamp()
-        expense['script_notes'] = 'Tracked by Python automation v2'
-        
+
+        # Record the key so duplicates WITHIN this batch are also caught
+        if key is not None:
+            seen.add(key)
+
+        # Add system-managed fields (IDs come from the precomputed batch;
+        # valid_expenses hasn't grown yet, so its length is the next index)
+        expense.expense_id = expense_ids[len(valid_expenses)]
+        expense.processed = True
+        expense.processed_at = batch_timestamp
+        expense.script_notes = 'Tracked by Python automation v2'
+
         # Add to valid expenses list
         valid_expenses.append(expense)
-    
-    # Batch add all valid expenses at once
-    if valid_expenses:
-        # Prepare rows for batch append
-        # Column order: date, description, amount, category, payment_method,
-        #               expense_id, processed, processed_at, script_notes
-        rows_to_add = []
-        for expense in valid_expenses:
-            row = [
-                expense.get('date', ''),
-                expense.get('description', ''),
-                expense.get('amount', ''),
-                expense.get('category', ''),
-                expense.get('payment_method', ''),
-                expense.get('expense_id', ''),
-                expense.get('processed', ''),
-                expense.get('processed_at', ''),
-                expense.get('script_notes', '')
-            ]
-            rows_to_add.append(row)
-        
-        # Batch append all rows in a single API call
-        # This is much more efficient than individual append_row calls
-        sheet.append_rows(rows_to_add)
-    
+
+    # Prepare rows for batch append - the Expense field order already
+    # matches the worksheet columns A-I
+    rows_to_add = [expense_to_row(expense) for expense in valid_expenses]
+
+    # Flush the Expenses append and the Errors-sheet writes concurrently.
+    # They target different worksheets and don't depend on each other,
+    # so there is no reason to wait on one before starting the other.
+    if rows_to_add or error_rows:
+        asyncio.run(_flush_writes(sheet, rows_to_add, spreadsheet, error_rows))
+
+    if rows_to_add:
+        # Don't re-read what we just wrote: the new keys are already in
+        # the index, so only the cache bookkeeping needs updating
+        _advance_cached_index(sheet, len(rows_to_add), seen)
+
     # Return summary
     return {
         'success_count': len(valid_expenses),
@@ -310,3 +942,107 @@ def batch_add_expenses(sheet, expenses_list: list[dict], spreadsheet=None) -> di
         'errors': errors
     }
 
+
+def batch_add_expenses_df(sheet, expenses_list: list[dict], spreadsheet=None) -> dict:
+    """
+    Vectorized variant of batch_add_expenses for large imports.
+
+    Validation (required fields + numeric amount) and duplicate detection
+    run as column-wise pandas operations in C instead of a per-row Python
+    loop, which pays off from roughly a thousand rows up (bulk CSV
+    imports). Unlike batch_add_expenses there is no interactive prompting:
+    rows with missing fields or bad amounts go straight to the Errors
+    sheet. Requires pandas.
+
+    Args:
+        sheet: The gspread worksheet object (Expenses sheet)
+        expenses_list: List of expense dictionaries to process
+        spreadsheet: Optional spreadsheet object (needed for error logging)
+                     If not provided, will be extracted from sheet
+
+    Returns:
+        Same summary dictionary as batch_add_expenses.
+    """
+    if pd is None:
+        raise RuntimeError(
+            "pandas is required for batch_add_expenses_df - pip install pandas"
+        )
+
+    # Get spreadsheet object if not provided (needed for error logging)
+    if spreadsheet is None:
+        spreadsheet = sheet.spreadsheet
+
+    batch_timestamp = utc_timestamp()
+    if spreadsheet:
+        seen = load_batch_state(sheet, spreadsheet)
+    else:
+        seen = load_duplicate_index(sheet)
+
+    df = pd.DataFrame(expenses_list)
+    # Make sure every user-editable column exists, then normalize in C
+    for column in ('date', 'description', 'amount', 'category', 'payment_method'):
+        if column not in df.columns:
+            df[column] = ''
+    df = df.fillna('')
+
+    dates = df['date'].astype(str).str.strip()
+    descriptions = df['description'].astype(str).str.strip()
+    amounts = pd.to_numeric(df['amount'], errors='coerce')
+
+    # Vectorized validation masks
+    missing = (dates == '') | (descriptions == '')
+    bad_amount = amounts.isna() & ~missing
+
+    # Vectorized duplicate detection: against the sheet index and within
+    # the batch itself (duplicated() keeps each first occurrence)
+    keys = pd.Series(
+        list(zip(dates, descriptions.str.casefold(), amounts)), index=df.index
+    )
+    is_duplicate = (keys.isin(seen) | keys.duplicated()) & ~missing & ~bad_amount
+
+    valid_expenses = []
+    errors = []
+    error_rows = []
+
+    def _record_error(row_index, message, is_error_row=True):
+        expense = Expense.from_dict(df.loc[row_index].to_dict())
+        errors.append({'expense': expense, 'message': message})
+        if is_error_row and spreadsheet:
+            error_rows.append(format_error_row(expense, message, batch_timestamp))
+
+    for row_index in df.index[missing]:
+        _record_error(row_index, 'Missing required field (date/description/amount)')
+    for row_index in df.index[bad_amount]:
+        _record_error(row_index, 'Amount must be a valid number')
+    for row_index in df.index[is_duplicate]:
+        _record_error(row_index, 'Duplicate expense - skipped', is_error_row=False)
+
+    # Survivors become fully-populated Expense rows
+    ok = ~(missing | bad_amount | is_duplicate)
+    for row_index in df.index[ok]:
+        expense = Expense.from_dict(df.loc[row_index].to_dict())
+        expense.expense_id = generate_expense_id()
+        expense.processed = True
+        expense.processed_at = batch_timestamp
+        expense.script_notes = 'Tracked by Python automation v2'
+        valid_expenses.append(expense)
+        seen.add(keys.loc[row_index])
+
+    rows_to_add = [expense_to_row(expense) for expense in valid_expenses]
+
+    if rows_to_add or error_rows:
+        asyncio.run(_flush_writes(sheet, rows_to_add, spreadsheet, error_rows))
+
+    if rows_to_add:
+        # Don't re-read what we just wrote: the new keys are already in
+        # the index, so only the cache bookkeeping needs updating
+        _advance_cached_index(sheet, len(rows_to_add), seen)
+
+    return {
+        'success_count': len(valid_expenses),
+        'error_count': len(errors),
+        'duplicate_count': int(is_duplicate.sum()),
+        'added_expenses': valid_expenses,
+        'errors': errors
+    }
+
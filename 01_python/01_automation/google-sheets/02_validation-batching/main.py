@@ -2,8 +2,10 @@
 Main script for Google Sheets Expense Automation - Version 2
 Handles expense validation, duplicate checking, and batch operations.
 """
+import csv
+
 from sheets_client import get_sheet
-from expense_tracker import add_expense, batch_add_expenses, log_error
+from expense_tracker import add_expense, batch_add_expenses, expense_to_row, log_error
 
 # Configuration
 SPREADSHEET_ID = "1MEUDScbDaq2FhiNy8G8I3eeVItdrBLIaYvYjwZREVLs"
@@ -28,28 +30,18 @@ def add_single_expense(sheet, spreadsheet):
     expense_data['payment_method'] = input("Payment Method (optional): ").strip()
     
     # Add the expense (validation and duplicate checking happens inside)
-    success, expense_data, error_message = add_expense(sheet, expense_data)
-    
+    success, expense, error_message = add_expense(sheet, expense_data)
+
     if success:
-        # Add to sheet (single row append)
-        row = [
-            expense_data.get('date', ''),
-            expense_data.get('description', ''),
-            expense_data.get('amount', ''),
-            expense_data.get('category', ''),
-            expense_data.get('payment_method', ''),
-            expense_data.get('expense_id', ''),
-            expense_data.get('processed', ''),
-            expense_data.get('processed_at', ''),
-            expense_data.get('script_notes', '')
-        ]
-        sheet.append_row(row)
+        # Add to sheet (single row append) - the Expense field order
+        # already matches the worksheet columns
+        sheet.append_row(expense_to_row(expense))
         print(f"\n✅ Expense added successfully!")
-        print(f"   Expense ID: {expense_data.get('expense_id')}")
+        print(f"   Expense ID: {expense.expense_id}")
     else:
         # Log error
         print(f"\n❌ Error: {error_message}")
-        log_error(spreadsheet, expense_data, error_message)
+        log_error(spreadsheet, expense, error_message)
         print("   Error has been logged to the Errors sheet.")
 
 
@@ -88,19 +80,57 @@ def add_multiple_expenses(sheet, spreadsheet):
     # Process batch
     print(f"\nProcessing {len(expenses_list)} expense(s)...")
     result = batch_add_expenses(sheet, expenses_list, spreadsheet)
-    
-    # Display results
+    display_batch_results(result)
+
+
+def import_expenses_from_csv(sheet, spreadsheet):
+    """
+    Imports expenses from a CSV file in batch mode.
+
+    The CSV needs a header row with at least date, description, and
+    amount columns (category and payment_method are optional). Rows that
+    fail validation are logged to the Errors sheet instead of prompting -
+    batch mode never blocks on stdin, so it is safe for large files and
+    scheduled runs.
+    """
+    print("\n" + "="*50)
+    print("Import Expenses from CSV")
+    print("="*50)
+
+    file_path = input("\nPath to CSV file: ").strip()
+
+    try:
+        with open(file_path, newline='', encoding='utf-8-sig') as csv_file:
+            expenses_list = list(csv.DictReader(csv_file))
+    except OSError as e:
+        print(f"\n❌ Could not read file: {e}")
+        return
+
+    if not expenses_list:
+        print("\nNo expenses found in file.")
+        return
+
+    # Process batch (strict validation - no per-row prompting)
+    print(f"\nProcessing {len(expenses_list)} expense(s) from {file_path}...")
+    result = batch_add_expenses(sheet, expenses_list, spreadsheet)
+    display_batch_results(result)
+
+
+def display_batch_results(result):
+    """
+    Prints the summary returned by batch_add_expenses.
+    """
     print("\n" + "="*50)
     print("Batch Processing Results")
     print("="*50)
     print(f"✅ Successfully added: {result['success_count']}")
     print(f"❌ Errors: {result['error_count']}")
     print(f"⚠️  Duplicates skipped: {result['duplicate_count']}")
-    
+
     if result['errors']:
         print("\nErrors:")
         for error in result['errors']:
-            print(f"  - {error['message']}: {error['expense'].get('description', 'N/A')}")
+            print(f"  - {error['message']}: {error['expense'].description or 'N/A'}")
 
 
 def main():
@@ -127,20 +157,23 @@ def main():
         print("What would you like to do?")
         print("1. Add a single expense")
         print("2. Add multiple expenses (batch)")
-        print("3. Exit")
+        print("3. Import expenses from a CSV file")
+        print("4. Exit")
         print("-"*50)
-        
-        choice = input("\nEnter your choice (1-3): ").strip()
-        
+
+        choice = input("\nEnter your choice (1-4): ").strip()
+
         if choice == '1':
             add_single_expense(sheet, spreadsheet)
         elif choice == '2':
             add_multiple_expenses(sheet, spreadsheet)
         elif choice == '3':
+            import_expenses_from_csv(sheet, spreadsheet)
+        elif choice == '4':
             print("\n👋 Goodbye!")
             break
         else:
-            print("\n❌ Invalid choice. Please enter 1, 2, or 3.")
+            print("\n❌ Invalid choice. Please enter 1, 2, 3, or 4.")
 
 
 if __name__ == "__main__":
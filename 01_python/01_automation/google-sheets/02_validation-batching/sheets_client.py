@@ -1,17 +1,53 @@
+import json
+import types
+
 import gspread
 from google.oauth2.service_account import Credentials
 
+try:
+    # Optional: orjson decodes the large Sheets values responses ~2-3x
+    # faster than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    import requests.models
+
+    # Swap only the decode path used by response.json(). Request bodies
+    # keep stdlib dumps: orjson.dumps returns bytes and doesn't accept
+    # the allow_nan kwarg requests passes when serializing.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+    # requests' error handling is unaffected.
+    requests.models.complexjson = types.SimpleNamespace(
+        loads=orjson.loads,
+        dumps=json.dumps
+    )
+
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets"
 ]
 
-def get_sheet(spreadsheet_id: str, worksheet_name: str):
-    creds = Credentials.from_service_account_file(
-        "service_account.json",
-        scopes=SCOPES
-    )
 
-    client = gspread.authorize(creds)
+# One client per process: gspread's AuthorizedSession keeps the HTTPS
+# connection alive, so repeated get_sheet calls reuse the warm
+# connection instead of paying a fresh TCP + TLS handshake
+_client = None
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        creds = Credentials.from_service_account_file(
+            "service_account.json",
+            scopes=SCOPES
+        )
+        _client = gspread.authorize(creds)
+    return _client
+
+
+def get_sheet(spreadsheet_id: str, worksheet_name: str):
+    client = _get_client()
     spreadsheet = client.open_by_key(spreadsheet_id)
     worksheet = spreadsheet.worksheet(worksheet_name)
 
@@ -2,7 +2,9 @@ import uuid
 from datetime import datetime, timezone
 
 def generate_expense_id() -> str:
-    return str(uuid.uuid4())
+    # .hex skips the hyphenated str() formatting layer - same uniqueness,
+    # fewer allocations per ID on large batches
+    return uuid.uuid4().hex
 
 def utc_timestamp() -> str:
     return datetime.now(timezone.utc).isoformat()